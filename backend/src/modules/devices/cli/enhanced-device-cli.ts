@@ -18,6 +18,8 @@ import { SmartLedgersService } from '@hsuite/smart-ledgers';
 import { ChainType, ILedger } from '@hsuite/smart-ledgers';
 import { Client, PrivateKey } from '@hashgraph/sdk';
 import axios from 'axios';
+import * as http from 'http';
+import { isRetryableHttpError, retryWithBackoff } from '../../../shared/helpers';
 const inquirer = require('inquirer');
 
 /**
@@ -78,6 +80,18 @@ export class EnhancedDeviceCommand extends CommandRunner implements OnModuleInit
   private client: Client;
   private chain: ChainType;
   private readonly API_BASE = 'http://localhost:3001';
+  // Reuse a small pool of keep-alive sockets instead of a new connection per call,
+  // with Nagle disabled so small requests are not held back waiting for ACKs
+  private readonly api = axios.create({
+    baseURL: this.API_BASE,
+    timeout: 10000,
+    httpAgent: new http.Agent({ keepAlive: true, maxSockets: 4, noDelay: true })
+  });
+  // Cached reachability so a burst of calls shares one probe and skips a known-down API
+  private readonly API_OK_TTL_MS = 30000;
+  private readonly API_DOWN_TTL_MS = 5000;
+  private apiStatus: { reachable: boolean; until: number } = { reachable: false, until: 0 };
+  private apiProbe: Promise<boolean> | null = null;
   private currentDeviceId: string | null = null;
   private currentPrivateKey: string | null = null;
 
@@ -343,14 +357,49 @@ export class EnhancedDeviceCommand extends CommandRunner implements OnModuleInit
 
   // Helper methods for API calls
   private async makeApiCall(endpoint: string): Promise<any> {
+    if (!(await this.isApiReachable())) {
+      return null;
+    }
+
     try {
-      const response = await axios.get(`${this.API_BASE}${endpoint}`);
+      const response = await retryWithBackoff(
+        () => this.api.get(endpoint),
+        { maxRetries: 2, baseDelayMs: 500, isRetryable: isRetryableHttpError }
+      );
       return response.data;
     } catch (error) {
+      if (!error.response) {
+        // The API went away, make the next call probe again
+        this.apiStatus = { reachable: false, until: 0 };
+      }
       return null;
     }
   }
 
+  /**
+   * Checks that the API answers at all with a body-less HEAD request.
+   * Any HTTP response counts as reachable; the result is cached so callers
+   * don't each pay for a probe, or for retries against a server that is down.
+   */
+  private async isApiReachable(): Promise<boolean> {
+    if (performance.now() < this.apiStatus.until) {
+      return this.apiStatus.reachable;
+    }
+
+    if (!this.apiProbe) {
+      this.apiProbe = this.api.head('/sensors/status', { timeout: 2000 })
+        .then(() => true, (error) => !!error.response)
+        .then((reachable) => {
+          const ttl = reachable ? this.API_OK_TTL_MS : this.API_DOWN_TTL_MS;
+          this.apiStatus = { reachable, until: performance.now() + ttl };
+          this.apiProbe = null;
+          return reachable;
+        });
+    }
+
+    return this.apiProbe;
+  }
+
   private async getDeviceCount(): Promise<number> {
     try {
       const devices = await this.deviceModel.countDocuments();
@@ -550,14 +599,20 @@ export class EnhancedDeviceCommand extends CommandRunner implements OnModuleInit
         '/sensors/dht11/status'
       ];
 
-      for (const endpoint of sensorEndpoints) {
-        try {
-          await this.makeApiCall(endpoint);
-          console.log(`✅ ${endpoint.split('/')[1]} service started`);
-        } catch (error) {
-          console.log(`⚠️  ${endpoint.split('/')[1]} service already running`);
+      // Trigger all services at once instead of waiting on each round trip in turn.
+      // makeApiCall never rejects, it returns null when the call failed
+      const results = await Promise.all(
+        sensorEndpoints.map(endpoint => this.makeApiCall(endpoint))
+      );
+
+      results.forEach((result, index) => {
+        const service = sensorEndpoints[index].split('/')[1];
+        if (result !== null) {
+          console.log(`✅ ${service} service started`);
+        } else {
+          console.log(`⚠️  ${service} service did not respond (already running or API unreachable)`);
         }
-      }
+      });
 
       console.log('');
       console.log('📊 Sensor data collection started successfully!');
@@ -11,6 +11,12 @@ import { ReadGeoMedallionDto } from './dto/read-geo-medallion.dto';
 import { PurchaseGeoMedallionDto } from './dto/purchase-geo-medallion.dto';
 import { Config } from '../config/entities/config.entity';
 
+// Unit offsets for the 6 hexagon vertices (angles: 0°, 60°, 120°, 180°, 240°, 300°)
+const HEXAGON_UNIT_VERTICES = Array.from({ length: 6 }, (_, i) => {
+  const angle = (i * 60) * Math.PI / 180;
+  return { sin: Math.sin(angle), cos: Math.cos(angle) };
+});
+
 /**
  * @interface IPaginatedResult
  * @description Paginated result interface
@@ -141,12 +147,13 @@ export class GeoMedallionsService {
     const kmPerDegreeLat = 111; // Approximate km per degree latitude
     const kmPerDegreeLng = 111 * Math.cos(centerLat * Math.PI / 180); // Adjust for longitude at this latitude
     
-    // Generate 6 vertices for a regular hexagon (angles: 0°, 60°, 120°, 180°, 240°, 300°)
-    for (let i = 0; i < 6; i++) {
-      const angle = (i * 60) * Math.PI / 180; // Convert to radians
-      
-      const deltaLat = (radiusKm / kmPerDegreeLat) * Math.sin(angle);
-      const deltaLng = (radiusKm / kmPerDegreeLng) * Math.cos(angle);
+    const latScale = radiusKm / kmPerDegreeLat;
+    const lngScale = radiusKm / kmPerDegreeLng;
+    
+    // Generate 6 vertices for a regular hexagon from the precomputed unit offsets
+    for (const { sin, cos } of HEXAGON_UNIT_VERTICES) {
+      const deltaLat = latScale * sin;
+      const deltaLng = lngScale * cos;
       
       vertices.push({
         latitude: centerLat + deltaLat,
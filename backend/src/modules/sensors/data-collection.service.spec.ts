@@ -0,0 +1,187 @@
+/**
+ * @module DataCollectionServiceSpec
+ * @description Unit tests for DataCollectionService batch processing
+ *
+ * Covers the retry rules around the irreversible steps of a batch: topic
+ * submission and reward transfer must never run twice for the same readings.
+ */
+import { Test, TestingModule } from '@nestjs/testing';
+import { getModelToken } from '@nestjs/mongoose';
+import { Types } from 'mongoose';
+import { DataCollectionService } from './data-collection.service';
+import { TemperatureReading } from './entities/temperature-reading.entity';
+import { TemperatureAnalysis } from './entities/temperature-analysis.entity';
+import { Device } from '../devices/entities/device.entity';
+import { Config } from '../config/entities/config.entity';
+import { SmartNodeCommonService } from '../smartnode-common.service';
+
+// Minimal stand-in for a chained mongoose query
+const query = (result: any) => ({
+  select: jest.fn().mockReturnThis(),
+  lean: jest.fn().mockReturnThis(),
+  exec: jest.fn().mockResolvedValue(result),
+});
+
+const exec = (result: any = {}) => ({ exec: jest.fn().mockResolvedValue(result) });
+
+describe('DataCollectionService', () => {
+  let service: DataCollectionService;
+  let sendRewardTokens: jest.SpyInstance;
+
+  const mockTemperatureReadingModel = { insertMany: jest.fn(), updateMany: jest.fn() };
+  const mockTemperatureAnalysisModel = { find: jest.fn(), replaceOne: jest.fn(), updateOne: jest.fn() };
+  const mockDeviceModel = { findOne: jest.fn() };
+  const mockSmartNodeCommonService = { submitMessageToTopic: jest.fn() };
+
+  const makeReadings = (length = 10) => Array.from({ length }, (_, i) => ({
+    _id: new Types.ObjectId(),
+    deviceId: 'device-1',
+    value: 20 + i,
+    timestamp: new Date(Date.UTC(2025, 0, 1, 0, 0, i * 10)).toISOString(),
+  }));
+
+  const makeSession = (readings: any[]): any => ({
+    deviceId: 'device-1',
+    privateKey: 'mockPrivateKey',
+    isActive: true,
+    batchCount: 0,
+    readings: [...readings],
+    processing: Promise.resolve(),
+    failedBatches: 0,
+    retryAt: 0,
+  });
+
+  const dispatch = (session: any): Promise<void> => (service as any).dispatchReadingsBatch(session);
+  const saveReadings = (readings: any[]): Promise<void> => (service as any).saveReadings(readings);
+
+  beforeEach(async () => {
+    jest.resetAllMocks();
+
+    mockTemperatureAnalysisModel.find.mockReturnValue(query([]));
+    mockTemperatureAnalysisModel.replaceOne.mockReturnValue(exec());
+    mockTemperatureAnalysisModel.updateOne.mockReturnValue(exec());
+    mockTemperatureReadingModel.updateMany.mockReturnValue(exec());
+    mockDeviceModel.findOne.mockReturnValue(query({ hcsTopic: '0.0.1001', hederaAccount: '0.0.2002' }));
+    mockSmartNodeCommonService.submitMessageToTopic.mockResolvedValue({ transactionId: '0.0.123456@1.1', consensusTimestamp: '1.1' });
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        DataCollectionService,
+        { provide: getModelToken(TemperatureReading.name), useValue: mockTemperatureReadingModel },
+        { provide: getModelToken(TemperatureAnalysis.name), useValue: mockTemperatureAnalysisModel },
+        { provide: getModelToken(Device.name), useValue: mockDeviceModel },
+        { provide: getModelToken(Config.name), useValue: {} },
+        { provide: SmartNodeCommonService, useValue: mockSmartNodeCommonService },
+      ],
+    }).compile();
+
+    service = module.get<DataCollectionService>(DataCollectionService);
+    sendRewardTokens = jest.spyOn(service as any, 'sendRewardTokens').mockResolvedValue(undefined);
+  });
+
+  it('should split recovered readings into batches of BATCH_SIZE, oldest first', async () => {
+    const readings = makeReadings(25);
+    const session = makeSession(readings);
+
+    await dispatch(session);
+
+    const [, stored] = mockTemperatureAnalysisModel.replaceOne.mock.calls[0];
+    expect(stored.readingIds).toEqual(readings.slice(0, 10).map(reading => reading._id));
+    expect(session.readings).toEqual(readings.slice(10));
+  });
+
+  it('should put a batch back with a backoff when it fails before the topic submission', async () => {
+    mockDeviceModel.findOne.mockReturnValue(query(null));
+    const readings = makeReadings();
+    const session = makeSession(readings);
+
+    await dispatch(session);
+
+    expect(mockSmartNodeCommonService.submitMessageToTopic).not.toHaveBeenCalled();
+    expect(sendRewardTokens).not.toHaveBeenCalled();
+    expect(session.readings).toEqual(readings);
+    expect(session.batchCount).toBe(0);
+    expect(session.failedBatches).toBe(1);
+    expect(session.retryAt).toBeGreaterThan(Date.now());
+  });
+
+  it('should put a batch back when the topic submission fails', async () => {
+    mockSmartNodeCommonService.submitMessageToTopic.mockRejectedValue(new Error('Hedera unavailable'));
+    const readings = makeReadings();
+    const session = makeSession(readings);
+
+    await dispatch(session);
+
+    expect(sendRewardTokens).not.toHaveBeenCalled();
+    expect(mockTemperatureAnalysisModel.updateOne).not.toHaveBeenCalled();
+    expect(session.readings).toEqual(readings);
+    expect(session.failedBatches).toBe(1);
+    expect(session.retryAt).toBeGreaterThan(Date.now());
+  });
+
+  it('should not put a batch back once it has been submitted', async () => {
+    mockTemperatureReadingModel.updateMany.mockReturnValue({ exec: jest.fn().mockRejectedValue(new Error('write failed')) });
+    const session = makeSession(makeReadings());
+
+    await dispatch(session);
+
+    expect(mockSmartNodeCommonService.submitMessageToTopic).toHaveBeenCalledTimes(1);
+    expect(sendRewardTokens).toHaveBeenCalledTimes(1);
+    expect(session.readings).toEqual([]);
+    expect(session.retryAt).toBe(0);
+  });
+
+  it('should store the reading ids with the analysis before submitting it', async () => {
+    const readings = makeReadings();
+    const session = makeSession(readings);
+
+    await dispatch(session);
+
+    const [, stored] = mockTemperatureAnalysisModel.replaceOne.mock.calls[0];
+    expect(stored.readingIds).toEqual(readings.map(reading => reading._id));
+    const [, submitted] = mockSmartNodeCommonService.submitMessageToTopic.mock.calls[0];
+    expect(submitted.readingIds).toBeUndefined();
+  });
+
+  it('should only flag readings already covered by a submitted analysis and keep the rest', async () => {
+    const readings = makeReadings();
+    const submittedIds = readings.slice(0, 4).map(reading => reading._id);
+    mockTemperatureAnalysisModel.find.mockReturnValue(query([{ readingIds: submittedIds }]));
+    const session = makeSession(readings);
+
+    await dispatch(session);
+
+    expect(mockSmartNodeCommonService.submitMessageToTopic).not.toHaveBeenCalled();
+    expect(sendRewardTokens).not.toHaveBeenCalled();
+    expect(mockTemperatureReadingModel.updateMany).toHaveBeenCalledWith(
+      { _id: { $in: submittedIds } },
+      { processed: true }
+    );
+    expect(session.readings).toEqual(readings.slice(4));
+  });
+
+  it('should retry readings whose insert failed on the next tick, ignoring duplicates', async () => {
+    const [duplicate, failed, saved] = makeReadings(3);
+    mockTemperatureReadingModel.insertMany.mockRejectedValueOnce({
+      writeErrors: [{ index: 0, code: 11000 }, { index: 1, code: 91 }],
+    });
+
+    await saveReadings([duplicate, failed, saved]);
+
+    const [next] = makeReadings(1);
+    mockTemperatureReadingModel.insertMany.mockResolvedValueOnce([]);
+    await saveReadings([next]);
+
+    expect(mockTemperatureReadingModel.insertMany).toHaveBeenLastCalledWith([failed, next], { ordered: false });
+  });
+
+  it('should keep every reading when the insert fails without write errors', async () => {
+    const readings = makeReadings(2);
+    mockTemperatureReadingModel.insertMany.mockRejectedValueOnce(new Error('connection lost'));
+
+    await saveReadings(readings);
+    await saveReadings([]);
+
+    expect(mockTemperatureReadingModel.insertMany).toHaveBeenLastCalledWith(readings, { ordered: false });
+  });
+});
@@ -1,7 +1,7 @@
 import { Injectable, Logger, BadRequestException, NotFoundException, OnModuleInit } from '@nestjs/common';
 import { InjectModel } from '@nestjs/mongoose';
-import { Model } from 'mongoose';
-import { Cron, CronExpression } from '@nestjs/schedule';
+import { Model, Types } from 'mongoose';
+import { Interval } from '@nestjs/schedule';
 import { TemperatureReading } from './entities/temperature-reading.entity';
 import { TemperatureAnalysis } from './entities/temperature-analysis.entity';
 import { Device } from '../devices/entities/device.entity';
@@ -10,14 +10,34 @@ import { SmartNodeCommonService } from '../smartnode-common.service';
 import { StartDataCollectionDto } from './dto/start-data-collection.dto';
 import { StopDataCollectionDto } from './dto/stop-data-collection.dto';
 import { Unit } from '../../shared/enums';
+import { getBackoffDelay } from '../../shared/helpers';
 import { Client, TransferTransaction, PrivateKey, Hbar, AccountId } from '@hashgraph/sdk';
 
+export const READING_INTERVAL_MS = 10000; // 10 seconds
+const MAX_BATCH_RETRY_DELAY_MS = 5 * 60 * 1000;
+
+/**
+ * processed: analysed, submitted and flagged
+ * retry: failed before the topic accepted the analysis, safe to process again
+ * dropped: failed after the topic accepted the analysis, retrying could pay the reward twice
+ */
+type BatchOutcome = 'processed' | 'retry' | 'dropped';
+
 interface DataCollectionSession {
   deviceId: string;
   privateKey: string;
   isActive: boolean;
   batchCount: number;   
   readings: any[];
+  processing: Promise<void>;
+  failedBatches: number; // Consecutive batches put back for retry
+  retryAt: number; // Epoch ms before which a put-back batch is not dispatched again
+  readingTemplate: {
+    deviceId: string;
+    unit: Unit.CELCIUS;
+    processed: false;
+    location?: { latitude: number; longitude: number };
+  };
   startTime: string;
   lastReading: string;
 }
@@ -26,8 +46,11 @@ interface DataCollectionSession {
 export class DataCollectionService implements OnModuleInit {
   private readonly logger = new Logger(DataCollectionService.name);
   private activeSessions = new Map<string, DataCollectionSession>();
+  private isCollecting = false;
+  private tickPending = false;
+  private unsavedReadings: any[] = []; // Readings whose insert failed, retried on the next tick
   private readonly BATCH_SIZE = 10;
-  private readonly READING_INTERVAL_MS = 10000; // 10 seconds
+  private readonly MAX_PENDING_READINGS = 100; // Cap on unprocessed readings kept per session
   
   constructor(
     @InjectModel(TemperatureReading.name)
@@ -68,11 +91,12 @@ export class DataCollectionService implements OnModuleInit {
 
       this.logger.log(`Found ${activeDevices.length} active devices`);
 
-      for (const device of activeDevices) {
-        if (!this.activeSessions.has(device.deviceId)) {
-          await this.startDataCollectionInternal(device.deviceId, device.privateKey);
-        }
-      }
+      // Each start waits on its own pending-readings query, so run them side by side
+      await Promise.all(
+        activeDevices
+          .filter(device => !this.activeSessions.has(device.deviceId))
+          .map(device => this.startDataCollectionInternal(device))
+      );
     } catch (error) {
       this.logger.error('Error starting data collection for active devices:', error);
     }
@@ -81,44 +105,75 @@ export class DataCollectionService implements OnModuleInit {
   /**
    * Internal method to start data collection without external validation
    */
-  private async startDataCollectionInternal(deviceId: string, privateKey: string) {
+  private async startDataCollectionInternal(device: Device) {
     try {
-      const session: DataCollectionSession = {
-        deviceId,
-        privateKey,
-        isActive: true,
-        batchCount: 0,
-        readings: [],
-        startTime: new Date().toISOString(),
-        lastReading: new Date().toISOString()
-      };
+      const session = await this.createSession(device);
+
+      // A manual start may have won the race while pending readings were loading
+      if (this.activeSessions.has(device.deviceId)) {
+        return;
+      }
 
-      this.activeSessions.set(deviceId, session);
-      this.logger.log(`🌡️ Data collection started automatically for device: ${deviceId}`);
+      this.activeSessions.set(device.deviceId, session);
+      this.logger.log(`🌡️ Data collection started automatically for device: ${device.deviceId}`);
     } catch (error) {
-      this.logger.error(`Failed to start data collection for device ${deviceId}:`, error);
+      this.logger.error(`Failed to start data collection for device ${device.deviceId}:`, error);
     }
   }
 
   /**
-   * Start data collection for a device
+   * Build a session, resolving once the device data that stays fixed for its lifetime
    */
-  async startDataCollection(dto: StartDataCollectionDto): Promise<{ status: string; message: string; deviceId: string; isActive: boolean }> {
-    this.logger.log(`Starting data collection for device: ${dto.deviceId}`);
+  private async createSession(device: Device): Promise<DataCollectionSession> {
+    const now = new Date().toISOString();
+
+    return {
+      deviceId: device.deviceId,
+      privateKey: device.privateKey,
+      isActive: true,
+      batchCount: 0,
+      readings: await this.loadPendingReadings(device.deviceId),
+      processing: Promise.resolve(),
+      failedBatches: 0,
+      retryAt: 0,
+      readingTemplate: {
+        deviceId: device.deviceId,
+        unit: Unit.CELCIUS,
+        processed: false,
+        location: this.getDeviceLocation(device)
+      },
+      startTime: now,
+      lastReading: now
+    };
+  }
 
-    // Validate device exists and has necessary configuration
-    const device = await this.deviceModel.findOne({ deviceId: dto.deviceId }).exec();
+  /**
+   * Load a device and check the caller's private key against it
+   */
+  private async findAuthorizedDevice(deviceId: string, privateKey: string): Promise<Device> {
+    const device = await this.deviceModel.findOne({ deviceId }).exec();
     if (!device) {
-      throw new NotFoundException(`Device ${dto.deviceId} not found`);
+      throw new NotFoundException(`Device ${deviceId} not found`);
     }
 
-    if (!device.hcsTopic) {
-      throw new BadRequestException(`Device ${dto.deviceId} does not have an HCS topic configured`);
+    if (device.privateKey !== privateKey) {
+      throw new BadRequestException('Invalid private key for device');
     }
 
-    // Validate private key matches device
-    if (device.privateKey !== dto.privateKey) {
-      throw new BadRequestException('Invalid private key for device');
+    return device;
+  }
+
+  /**
+   * Start data collection for a device
+   */
+  async startDataCollection(dto: StartDataCollectionDto): Promise<{ status: string; message: string; deviceId: string; isActive: boolean }> {
+    this.logger.log(`Starting data collection for device: ${dto.deviceId}`);
+
+    // Validate device exists and the private key matches before looking at its
+    // configuration, so a caller with the wrong key learns nothing about the device
+    const device = await this.findAuthorizedDevice(dto.deviceId, dto.privateKey);
+    if (!device.hcsTopic) {
+      throw new BadRequestException(`Device ${dto.deviceId} does not have an HCS topic configured`);
     }
 
     // Check if session already exists
@@ -126,16 +181,11 @@ export class DataCollectionService implements OnModuleInit {
       throw new BadRequestException(`Data collection already active for device ${dto.deviceId}`);
     }
 
-    // Create new session
-    const session: DataCollectionSession = {
-      deviceId: dto.deviceId,
-      privateKey: dto.privateKey,
-      isActive: true,
-      batchCount: 0,
-      readings: [],
-      startTime: new Date().toISOString(),
-      lastReading: new Date().toISOString()
-    };
+    // Create new session, checking again since another start may have finished meanwhile
+    const session = await this.createSession(device);
+    if (this.activeSessions.has(dto.deviceId)) {
+      throw new BadRequestException(`Data collection already active for device ${dto.deviceId}`);
+    }
 
     this.activeSessions.set(dto.deviceId, session);
 
@@ -160,16 +210,8 @@ export class DataCollectionService implements OnModuleInit {
   async stopDataCollection(dto: StopDataCollectionDto): Promise<{ status: string; message: string; deviceId: string; isActive: boolean }> {
     this.logger.log(`Stopping data collection for device: ${dto.deviceId}`);
 
-    // Validate device exists
-    const device = await this.deviceModel.findOne({ deviceId: dto.deviceId }).exec();
-    if (!device) {
-      throw new NotFoundException(`Device ${dto.deviceId} not found`);
-    }
-
-    // Validate private key matches device
-    if (device.privateKey !== dto.privateKey) {
-      throw new BadRequestException('Invalid private key for device');
-    }
+    // Validate device exists and the private key matches
+    await this.findAuthorizedDevice(dto.deviceId, dto.privateKey);
 
     // Check if session exists
     const session = this.activeSessions.get(dto.deviceId);
@@ -177,9 +219,12 @@ export class DataCollectionService implements OnModuleInit {
       throw new BadRequestException(`No active data collection session for device ${dto.deviceId}`);
     }
 
-    // Process any remaining readings in the batch
-    if (session.readings.length > 0) {
-      await this.processReadingsBatch(session);
+    // Let in-flight batches finish, then process any remaining readings batch by batch.
+    // A batch put back for retry stays unflagged in the database for the next session
+    await session.processing;
+    const remainingBatches = Math.ceil(session.readings.length / this.BATCH_SIZE);
+    for (let i = 0; i < remainingBatches && session.retryAt <= Date.now(); i++) {
+      await this.dispatchReadingsBatch(session);
     }
 
     // Remove session
@@ -227,121 +272,342 @@ export class DataCollectionService implements OnModuleInit {
   }
 
   /**
-   * Cron job to collect data every 10 seconds
+   * Collect data every READING_INTERVAL_MS
    */
-  @Cron(CronExpression.EVERY_10_SECONDS)
+  @Interval(READING_INTERVAL_MS)
   async collectDataFromActiveSessions() {
     if (this.activeSessions.size === 0) {
       return; // No active sessions, skip
     }
 
+    // Never let a slow tick overlap with the next one, but don't drop it either:
+    // missed ticks collapse into one catch-up run so the reading rate holds
+    if (this.isCollecting) {
+      if (!this.tickPending) {
+        this.logger.warn('Data collection falling behind, running the missed tick once the current one finishes');
+      }
+      this.tickPending = true;
+      return;
+    }
+
+    this.isCollecting = true;
+    try {
+      do {
+        this.tickPending = false;
+        await this.collectReadings();
+      } while (this.tickPending);
+    } finally {
+      this.isCollecting = false;
+      this.tickPending = false;
+    }
+  }
+
+  /**
+   * Collect one reading per active session, persist them and dispatch completed batches
+   */
+  private async collectReadings() {
     this.logger.debug(`📊 Collecting data from ${this.activeSessions.size} active sessions`);
-    
-    for (const [deviceId, session] of this.activeSessions) {
-      if (session.isActive) {
-        await this.collectSingleReading(session);
+
+    const readings = [];
+    const completedSessions: DataCollectionSession[] = [];
+
+    for (const session of this.activeSessions.values()) {
+      if (!session.isActive) {
+        continue;
+      }
+
+      const reading = this.collectSingleReading(session);
+      if (!reading) {
+        continue;
+      }
+
+      readings.push(reading);
+      if (session.readings.length >= this.BATCH_SIZE && Date.now() >= session.retryAt) {
+        completedSessions.push(session);
       }
     }
+
+    // Persist the readings of every session in a single round trip
+    await this.saveReadings(readings);
+
+    for (const session of completedSessions) {
+      this.dispatchReadingsBatch(session);
+    }
   }
 
   /**
-   * Simulate collecting a single temperature reading
+   * Hand the session's oldest BATCH_SIZE readings over to its background processing chain
+   *
+   * Sampling never waits for the AI analysis, topic submission and reward transfer,
+   * while batches of the same device are still processed one after another. Taking fixed
+   * size batches oldest first keeps recovered readings on the boundaries they had before.
    */
-  private async collectSingleReading(session: DataCollectionSession) {
+  private dispatchReadingsBatch(session: DataCollectionSession): Promise<void> {
+    const readings = session.readings.splice(0, this.BATCH_SIZE);
+
+    session.processing = session.processing.then(async () => {
+      this.logger.log(`🔄 Batch complete! Processing ${readings.length} readings for device ${session.deviceId}`);
+
+      const outcome = await this.processReadingsBatch(session, readings);
+      if (outcome === 'processed') {
+        session.batchCount++;
+        session.failedBatches = 0;
+        session.retryAt = 0;
+        return;
+      }
+
+      if (outcome === 'dropped') {
+        // The topic already holds this analysis; the readings stay unflagged in the
+        // database and are only flagged if a later recovery finds its transaction hash
+        return;
+      }
+
+      // Put the failed batch back ahead of the readings collected in the meantime,
+      // and hold off dispatching it again with an exponential backoff
+      session.readings = [...readings, ...session.readings].slice(-this.MAX_PENDING_READINGS);
+      session.retryAt = Date.now() + getBackoffDelay(session.failedBatches++, READING_INTERVAL_MS, MAX_BATCH_RETRY_DELAY_MS);
+    });
+
+    return session.processing;
+  }
+
+  /**
+   * Simulate collecting a single temperature reading and add it to the session batch
+   */
+  private collectSingleReading(session: DataCollectionSession): any | null {
     try {
       // Simulate temperature reading (in a real scenario, this would come from actual sensors)
       const temperature = this.generateMockTemperature();
-      
+      const timestamp = new Date().toISOString();
+
       const reading = {
-        deviceId: session.deviceId,
+        ...session.readingTemplate,
+        _id: new Types.ObjectId(),
         value: temperature,
-        unit: Unit.CELCIUS,
-        timestamp: new Date().toISOString(),
-        location: await this.getDeviceLocation(session.deviceId)
+        timestamp
       };
 
-      // Add to batch
+      // Add to batch, dropping the oldest reading once the pending cap is reached
       session.readings.push(reading);
-      session.lastReading = new Date().toISOString();
+      if (session.readings.length > this.MAX_PENDING_READINGS) {
+        session.readings.shift();
+      }
+      session.lastReading = timestamp;
 
-      this.logger.log(`🌡️ Reading ${session.readings.length}/${this.BATCH_SIZE} for device ${session.deviceId}: ${temperature}°C`);
+      this.logger.debug(`🌡️ Reading ${session.readings.length}/${this.BATCH_SIZE} for device ${session.deviceId}: ${temperature}°C`);
 
-      // Save individual reading to database
-      await this.temperatureReadingModel.create(reading);
+      return reading;
+    } catch (error) {
+      this.logger.error(`Error collecting reading for device ${session.deviceId}:`, error);
+      return null;
+    }
+  }
 
-      // Check if batch is complete
-      if (session.readings.length >= this.BATCH_SIZE) {
-        this.logger.log(`🔄 Batch complete! Processing ${this.BATCH_SIZE} readings for device ${session.deviceId}`);
-        await this.processReadingsBatch(session);
-        session.readings = [];
-        session.batchCount++;
+  /**
+   * Save the readings collected during a tick, plus any left over from a failed insert,
+   * with a single bulk insert
+   *
+   * Readings carry their _id from the start, so a retried insert of a reading that did get
+   * written fails with a duplicate key, which counts as saved.
+   */
+  private async saveReadings(readings: any[]): Promise<void> {
+    const pending = this.unsavedReadings.length > 0 ? [...this.unsavedReadings, ...readings] : readings;
+    this.unsavedReadings = [];
+    if (pending.length === 0) {
+      return;
+    }
+
+    try {
+      await this.temperatureReadingModel.insertMany(pending, { ordered: false });
+    } catch (error) {
+      // With ordered: false only the documents listed in writeErrors failed;
+      // without that list nothing is known to be written
+      const writeErrors: any[] | undefined = error?.writeErrors;
+      const unsaved = writeErrors
+        ? writeErrors.filter(writeError => writeError.code !== 11000).map(writeError => pending[writeError.index])
+        : pending;
+
+      if (unsaved.length === 0) {
+        return;
       }
+
+      // Same bound as the in-memory batches, dropping the oldest first
+      const maxUnsaved = this.MAX_PENDING_READINGS * Math.max(1, this.activeSessions.size);
+      this.unsavedReadings = unsaved.slice(-maxUnsaved);
+      this.logger.error(`Error saving ${unsaved.length} readings, retrying on the next tick:`, error);
+    }
+  }
+
+  /**
+   * Load readings that were persisted but never made it into a processed batch
+   *
+   * Only readings written with an explicit `processed: false` are recovered. Rows
+   * stored before recovery existed have no flag and were already analysed and
+   * rewarded, so they must never be batched again.
+   */
+  private async loadPendingReadings(deviceId: string): Promise<any[]> {
+    try {
+      const pendingReadings = await this.temperatureReadingModel
+        .find({ deviceId, processed: false })
+        .sort({ timestamp: -1 })
+        .limit(this.MAX_PENDING_READINGS)
+        .lean()
+        .exec();
+
+      if (pendingReadings.length > 0) {
+        this.logger.log(`♻️ Recovered ${pendingReadings.length} unprocessed readings for device ${deviceId}`);
+      }
+
+      return pendingReadings.reverse().map(reading => ({
+        _id: reading._id,
+        deviceId: reading.deviceId,
+        value: reading.value,
+        unit: reading.unit,
+        timestamp: new Date(reading.timestamp).toISOString(),
+        location: reading.location
+      }));
     } catch (error) {
-      this.logger.error(`Error collecting reading for device ${session.deviceId}:`, error);
+      this.logger.warn(`Could not load unprocessed readings for device ${deviceId}:`, error);
+      return [];
     }
   }
 
+  /**
+   * Flag the readings of a successfully processed batch so they are not recovered again
+   */
+  private async markReadingsProcessed(readings: any[]): Promise<void> {
+    // Readings still waiting for their insert get written already flagged
+    for (const reading of readings) {
+      reading.processed = true;
+    }
+
+    await this.temperatureReadingModel.updateMany(
+      { _id: { $in: readings.map(reading => reading._id) } },
+      { processed: true }
+    ).exec();
+  }
+
   /**
    * Process a batch of readings with AI analysis
+   *
+   * Topic submission and the reward transfer cannot be undone, so the analysis is stored
+   * together with its reading ids before either happens. Readings already covered by a
+   * submitted analysis are only flagged as processed, and the rest of the batch goes back
+   * to the session to be analysed on its own.
    */
-  private async processReadingsBatch(session: DataCollectionSession) {
+  private async processReadingsBatch(session: DataCollectionSession, readings: any[]): Promise<BatchOutcome> {
+    let submitted = false;
+
     try {
-      this.logger.log(`Processing batch for device ${session.deviceId} with ${session.readings.length} readings`);
+      this.logger.log(`Processing batch for device ${session.deviceId} with ${readings.length} readings`);
 
       // Create AI analysis
-      const analysis = await this.createAIAnalysis(session.deviceId, session.readings);
+      const analysis = this.createAIAnalysis(session.deviceId, readings);
+
+      const readingIds = readings.map(reading => reading._id);
+
+      // Look the readings up individually, recovered batches need not line up with submitted ones
+      const submittedAnalyses = await this.temperatureAnalysisModel
+        .find({ readingIds: { $in: readingIds }, chainTxHash: { $nin: [null, ''] } })
+        .select('readingIds')
+        .lean<Pick<TemperatureAnalysis, 'readingIds'>[]>()
+        .exec();
+      if (submittedAnalyses.length > 0) {
+        const submittedIds = new Set<string>();
+        for (const submittedAnalysis of submittedAnalyses) {
+          for (const id of submittedAnalysis.readingIds) {
+            submittedIds.add(id.toString());
+          }
+        }
+
+        const alreadySubmitted = readings.filter(reading => submittedIds.has(reading._id.toString()));
+        const remaining = readings.filter(reading => !submittedIds.has(reading._id.toString()));
+
+        this.logger.warn(`${alreadySubmitted.length} readings for device ${session.deviceId} were already submitted, only flagging them`);
+        await this.markReadingsProcessed(alreadySubmitted);
+
+        // Readings collected since are newer, so the remainder goes back in front of them
+        session.readings.unshift(...remaining);
+        return 'processed';
+      }
 
-      // Get device information
-      const device = await this.deviceModel.findOne({ deviceId: session.deviceId }).exec();
+      // Get the only device fields the batch needs, as a plain object
+      const device = await this.deviceModel
+        .findOne({ deviceId: session.deviceId })
+        .select('hcsTopic hederaAccount')
+        .lean<Pick<Device, 'hcsTopic' | 'hederaAccount'>>()
+        .exec();
       if (!device || !device.hcsTopic) {
         throw new Error(`Device ${session.deviceId} not found or missing HCS topic`);
       }
 
-      // Submit to topic
-      await this.submitAnalysisToTopic(device.hcsTopic, analysis);
+      // Save analysis to database before anything irreversible happens
+      // The reading ids are kept out of the analysis itself, which must match the topic validator
+      await this.temperatureAnalysisModel.replaceOne({ batchId: analysis.batchId }, { ...analysis, readingIds }, { upsert: true }).exec();
+
+      // Submit to topic, once it is accepted the batch must not be retried
+      const chainTxHash = await this.submitAnalysisToTopic(device.hcsTopic, analysis);
+      submitted = true;
+      await this.temperatureAnalysisModel.updateOne({ batchId: analysis.batchId }, { chainTxHash }).exec();
 
       // Send rewards
       await this.sendRewardTokens(device);
 
-      // Save analysis to database
-      await this.temperatureAnalysisModel.create(analysis);
+      await this.markReadingsProcessed(readings);
 
       this.logger.log(`✅ Successfully processed batch ${session.batchCount} for device ${session.deviceId}`);
+      return 'processed';
     } catch (error) {
       this.logger.error(`Error processing batch for device ${session.deviceId}:`, error);
+      return submitted ? 'dropped' : 'retry';
     }
   }
 
   /**
    * Create AI analysis that matches device.topics.validator.json structure
    */
-  private async createAIAnalysis(deviceId: string, readings: any[]): Promise<any> {
-    const batchId = `batch_${deviceId}_${Date.now()}`;
-    const startTime = readings[0]?.timestamp || new Date().toISOString();
-    const endTime = readings[readings.length - 1]?.timestamp || new Date().toISOString();
-
-    // Calculate statistics
-    const temperatures = readings.map(r => r.value);
-    const averageTemperature = temperatures.reduce((a, b) => a + b, 0) / temperatures.length;
-    const minimumTemperature = Math.min(...temperatures);
-    const maximumTemperature = Math.max(...temperatures);
+  private createAIAnalysis(deviceId: string, readings: any[]): any {
+    // Reading timestamps are already ISO strings, so only the fallback needs formatting
+    const nowMs = Date.now();
+    const now = new Date(nowMs).toISOString();
+    // Stable across retries of the same batch, see processReadingsBatch
+    const batchId = `batch_${deviceId}_${readings[0]?._id ?? nowMs}`;
+    const startTime = readings[0]?.timestamp || now;
+    const endTime = readings[readings.length - 1]?.timestamp || now;
+
+    // Calculate mean, range and sum of squared deviations in a single pass (Welford)
+    let averageTemperature = 0;
+    let sumOfSquares = 0;
+    let minimumTemperature = Infinity;
+    let maximumTemperature = -Infinity;
+    let count = 0;
+
+    for (const { value } of readings) {
+      count++;
+      const delta = value - averageTemperature;
+      averageTemperature += delta / count;
+      sumOfSquares += delta * (value - averageTemperature);
+      if (value < minimumTemperature) minimumTemperature = value;
+      if (value > maximumTemperature) maximumTemperature = value;
+    }
 
     // Calculate standard deviation
-    const variance = temperatures.reduce((acc, temp) => acc + Math.pow(temp - averageTemperature, 2), 0) / temperatures.length;
+    const variance = sumOfSquares / readings.length;
     const standardDeviation = Math.sqrt(variance);
 
-    // Identify outliers (readings more than 2 standard deviations from mean)
-    const outliers = readings
-      .map(reading => ({
-        value: reading.value,
-        timestamp: reading.timestamp,
-        deviation: Math.abs(reading.value - averageTemperature) / standardDeviation
-      }))
-      .filter(item => item.deviation > 2);
+    // Identify outliers (readings more than 2 standard deviations from mean),
+    // only allocating entries for the readings that qualify
+    const outliers = [];
+    for (const { value, timestamp } of readings) {
+      const deviation = Math.abs(value - averageTemperature) / standardDeviation;
+      if (deviation > 2) {
+        outliers.push({ value, timestamp, deviation });
+      }
+    }
 
     // Simple trend analysis
-    const trendSlope = temperatures.length > 1 
-      ? (temperatures[temperatures.length - 1] - temperatures[0]) / (temperatures.length - 1)
+    const trendSlope = readings.length > 1 
+      ? (readings[readings.length - 1].value - readings[0].value) / (readings.length - 1)
       : 0;
 
     // Predictions (simple simulation)
@@ -372,8 +638,8 @@ export class DataCollectionService implements OnModuleInit {
       batchId,
       readingCount: readings.length,
       timeRange: {
-        start: new Date(startTime).toISOString(),
-        end: new Date(endTime).toISOString()
+        start: startTime,
+        end: endTime
       },
       averageTemperature,
       unit: Unit.CELCIUS,
@@ -389,7 +655,7 @@ export class DataCollectionService implements OnModuleInit {
         longitude: 0
       },
       chainTxHash: '',
-      analysisTimestamp: new Date().toISOString(),
+      analysisTimestamp: now,
       statisticalData: {
         standardDeviation,
         variance,
@@ -400,34 +666,20 @@ export class DataCollectionService implements OnModuleInit {
       }
     };
 
-    // Save analysis to database
-    await this.temperatureAnalysisModel.create({
-      ...analysis,
-      timeRange: {
-        start: analysis.timeRange.start,
-        end: analysis.timeRange.end
-      },
-      analysisTimestamp: analysis.analysisTimestamp
-    });
-
     return analysis;
   }
 
   /**
    * Submit analysis to device topic
+   *
+   * @returns the transaction ID of the topic message
    */
-  private async submitAnalysisToTopic(topicId: string, analysis: TemperatureAnalysis): Promise<void> {
+  private async submitAnalysisToTopic(topicId: string, analysis: TemperatureAnalysis): Promise<string> {
     try {
-        console.log('submitAnalysisToTopic', topicId, analysis);
       const result = await this.smartNodeCommonService.submitMessageToTopic(topicId, analysis);
-      
-      // Update analysis with transaction hash
-      await this.temperatureAnalysisModel.updateOne(
-        { batchId: analysis.batchId },
-        { chainTxHash: result.transactionId }
-      );
 
       this.logger.log(`🔗 Analysis submitted to topic ${topicId} with transaction ID: ${result.transactionId}`);
+      return result.transactionId;
     } catch (error) {
       this.logger.error(`Failed to submit analysis to topic ${topicId}:`, error);
       throw error;
@@ -437,7 +689,7 @@ export class DataCollectionService implements OnModuleInit {
   /**
    * Send reward tokens to device owner
    */
-  private async sendRewardTokens(device: Device): Promise<void> {
+  private async sendRewardTokens(device: Pick<Device, 'hederaAccount'>): Promise<void> {
     try {
       // Get reward configuration
       const config = await this.configModel.findOne().exec();
@@ -468,17 +720,12 @@ export class DataCollectionService implements OnModuleInit {
   /**
    * Get device location
    */
-  private async getDeviceLocation(deviceId: string): Promise<{ latitude: number; longitude: number } | undefined> {
-    try {
-      const device = await this.deviceModel.findOne({ deviceId }).exec();
-      if (device?.location?.coordinates) {
-        return {
-          longitude: device.location.coordinates[0],
-          latitude: device.location.coordinates[1]
-        };
-      }
-    } catch (error) {
-      this.logger.warn(`Could not get location for device ${deviceId}:`, error);
+  private getDeviceLocation(device: Device): { latitude: number; longitude: number } | undefined {
+    if (device.location?.coordinates) {
+      return {
+        longitude: device.location.coordinates[0],
+        latitude: device.location.coordinates[1]
+      };
     }
     return undefined;
   }
@@ -491,7 +738,8 @@ export class DataCollectionService implements OnModuleInit {
     const baseTemp = 22.5;
     const variation = 7.5;
     const noise = (Math.random() - 0.5) * 2; // -1 to 1
-    return parseFloat((baseTemp + (Math.random() - 0.5) * variation + noise).toFixed(2));
+    // Round to 2 decimals arithmetically rather than through a string round trip
+    return Math.round((baseTemp + (Math.random() - 0.5) * variation + noise) * 100) / 100;
   }
 
   /**
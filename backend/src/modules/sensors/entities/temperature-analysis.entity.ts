@@ -1,5 +1,5 @@
 import { Prop, Schema, SchemaFactory } from '@nestjs/mongoose';
-import { Document } from 'mongoose';
+import { Document, Types } from 'mongoose';
 import { Unit } from '../../../shared/enums';
 
 @Schema({ collection: 'temperature_analyses', timestamps: true })
@@ -7,7 +7,7 @@ export class TemperatureAnalysis extends Document {
   @Prop({ required: true })
   deviceId: string;
 
-  @Prop({ required: true })
+  @Prop({ required: true, index: true })
   batchId: string; // Unique identifier for this batch analysis
 
   @Prop({ required: true })
@@ -94,7 +94,10 @@ export class TemperatureAnalysis extends Document {
   @Prop({ required: false })
   chainTxHash?: string; // Hash of transaction sent to chain
 
-  @Prop({ required: true, default: new Date().toISOString() })
+  @Prop({ type: [Types.ObjectId], required: false, index: true })
+  readingIds?: Types.ObjectId[]; // Readings covered by this analysis, stored only, never submitted
+
+  @Prop({ required: true, default: () => new Date().toISOString() })
   analysisTimestamp: string;
 
   @Prop({ 
@@ -38,4 +38,7 @@ export class TemperatureReading extends Document {
   };
 }
 
-export const TemperatureReadingSchema = SchemaFactory.createForClass(TemperatureReading); 
\ No newline at end of file
+export const TemperatureReadingSchema = SchemaFactory.createForClass(TemperatureReading);
+
+// Serves the pending-readings lookup run when a collection session starts
+TemperatureReadingSchema.index({ deviceId: 1, processed: 1, timestamp: -1 }); 
\ No newline at end of file
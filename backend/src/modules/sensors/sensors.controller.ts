@@ -9,7 +9,8 @@ import {
   HttpCode,
   Logger,
 } from '@nestjs/common';
-import { DataCollectionService } from './data-collection.service';
+import { CacheTTL } from '@nestjs/cache-manager';
+import { DataCollectionService, READING_INTERVAL_MS } from './data-collection.service';
 import { StartDataCollectionDto } from './dto/start-data-collection.dto';
 import { StopDataCollectionDto } from './dto/stop-data-collection.dto';
 
@@ -41,12 +42,18 @@ export class SensorsController {
     return await this.dataCollectionService.stopDataCollection(dto);
   }
 
+  /**
+   * Raw readings and analyses only change once per collection tick, so
+   * responses are cached for one reading interval
+   */
   @Get('data-collection/raw')
+  @CacheTTL(READING_INTERVAL_MS)
   async getRawData(@Query('deviceId') deviceId: string) {
     return await this.dataCollectionService.getRawData(deviceId);
   }
 
   @Get('data-collection/analysis')
+  @CacheTTL(READING_INTERVAL_MS)
   async getAnalysis(@Query('deviceId') deviceId: string) {
     return await this.dataCollectionService.getAnalysis(deviceId);
   }
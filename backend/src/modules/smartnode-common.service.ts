@@ -21,6 +21,9 @@ import { Client, PrivateKey, Transaction } from '@hashgraph/sdk';
 import { ChainType, ILedger, SmartLedgersService } from '@hsuite/smart-ledgers';
 import { IHashgraph } from '@hsuite/hashgraph-types';
 
+// Shared encoder for message signing, stateless so one instance serves every call
+const textEncoder = new TextEncoder();
+
 /**
  * @interface ITopicCreationResult
  * @description Result of topic creation operation
@@ -67,6 +70,7 @@ export interface IValidatorCreationResult {
 export class SmartNodeCommonService implements OnModuleInit {
   private readonly logger: LoggerHelper = new LoggerHelper(SmartNodeCommonService.name);
   private readonly operator: IHashgraph.IOperator;
+  private operatorKey: PrivateKey;
   private client: Client;
   private ledger: ILedger;
   private chain: ChainType;
@@ -130,7 +134,7 @@ export class SmartNodeCommonService implements OnModuleInit {
       });
       
       const createTopicTx = Transaction.fromBytes(new Uint8Array(Buffer.from(createTopicTxBytes)));
-      const signedTx = await createTopicTx.sign(PrivateKey.fromString(this.operator.privateKey));
+      const signedTx = await createTopicTx.sign(this.getOperatorKey());
       const txResponse = await signedTx.execute(this.client);
       const receipt = await txResponse.getReceipt(this.client);
       const record = await txResponse.getRecord(this.client);
@@ -170,15 +174,18 @@ export class SmartNodeCommonService implements OnModuleInit {
     try {
       this.logger.debug(`Submitting message to topic ${topicId} with operator ${this.operator.accountId}`);
 
+      // Serialize once: the signed bytes and the submitted payload are the same string
+      const payload = JSON.stringify(message);
+
       // Create signature manually using operator private key
-      const messageBytes = new TextEncoder().encode(JSON.stringify(message));
-      const signature = PrivateKey.fromString(this.operator.privateKey).sign(messageBytes);
+      const messageBytes = textEncoder.encode(payload);
+      const signature = this.getOperatorKey().sign(messageBytes);
       this.logger.debug(`Message signature created for operator ${this.operator.accountId}`);
 
       // Generate transaction bytes using Smart Node SDK
       this.logger.debug(`Generating submit message transaction bytes...`);
       const submitMsgTxBytes = await this.smartNodeSdkService.sdk.hashgraph.hcs.submitMessage(topicId, {
-        message: JSON.stringify(message),
+        message: payload,
         signature: signature,
       } as IHashgraph.ILedger.IHCS.ITopic.IMessage.ISubmit);
       
@@ -243,7 +250,7 @@ export class SmartNodeCommonService implements OnModuleInit {
    */
   async signAndExecuteTransaction(transaction: Transaction): Promise<{ transactionId: string; consensusTimestamp: string }> {
     try {
-      const signedTx = await transaction.sign(PrivateKey.fromString(this.operator.privateKey));
+      const signedTx = await transaction.sign(this.getOperatorKey());
       const txResponse = await signedTx.execute(this.client);
       const record = await txResponse.getRecord(this.client);
       
@@ -259,6 +266,20 @@ export class SmartNodeCommonService implements OnModuleInit {
     }
   }
 
+  /**
+   * @method getOperatorKey
+   * @description Gets the operator private key, parsing it only on first use
+   * 
+   * @returns {PrivateKey} The operator private key
+   * @private
+   */
+  private getOperatorKey(): PrivateKey {
+    if (!this.operatorKey) {
+      this.operatorKey = PrivateKey.fromString(this.operator.privateKey);
+    }
+    return this.operatorKey;
+  }
+
   /**
    * @method getOperator
    * @description Gets the current operator information
@@ -12,8 +12,10 @@
  */
 import { DeviceClientService, IDeviceOperations } from '../sockets/device-client.service';
 import { LoggerHelper } from '@hsuite/helpers';
+import { getBackoffDelay } from '../shared/helpers';
 import * as fs from 'fs';
 import * as path from 'path';
+import { spawn } from 'child_process';
 
 /**
  * @class RaspberryPiDeviceOperations
@@ -23,6 +25,10 @@ class RaspberryPiDeviceOperations implements IDeviceOperations {
   private logger: LoggerHelper = new LoggerHelper('RaspberryPiDeviceOperations');
   private isRunning: boolean = false;
   private sensorProcess: any = null;
+  private restartAttempts: number = 0;
+  private restartTimer: NodeJS.Timeout = null;
+  private readonly maxRestartAttempts: number = 5;
+  private readonly stableUptimeMs: number = 60000; // Uptime after which a crash counts as a fresh failure
 
   /**
    * @method start
@@ -45,24 +51,8 @@ class RaspberryPiDeviceOperations implements IDeviceOperations {
       }
 
       // Start the Python sensor script
-      const { spawn } = require('child_process');
-      this.sensorProcess = spawn('python3', [scriptPath], {
-        stdio: 'pipe'
-      });
-
-      this.sensorProcess.stdout.on('data', (data) => {
-        this.logger.debug(`Sensor output: ${data.toString()}`);
-      });
-
-      this.sensorProcess.stderr.on('data', (data) => {
-        this.logger.error(`Sensor error: ${data.toString()}`);
-      });
-
-      this.sensorProcess.on('close', (code) => {
-        this.logger.debug(`Sensor process exited with code ${code}`);
-        this.isRunning = false;
-        this.sensorProcess = null;
-      });
+      this.restartAttempts = 0;
+      this.spawnSensorProcess(scriptPath);
 
       this.isRunning = true;
       this.logger.debug('DHT11 sensor started successfully');
@@ -85,27 +75,32 @@ class RaspberryPiDeviceOperations implements IDeviceOperations {
       }
 
       this.logger.debug('Stopping DHT11 sensor data collection...');
-      
-      if (this.sensorProcess) {
-        this.sensorProcess.kill('SIGTERM');
+
+      // Mark as stopped first so the exit below is not treated as a crash
+      this.isRunning = false;
+      if (this.restartTimer) {
+        clearTimeout(this.restartTimer);
+        this.restartTimer = null;
+      }
+
+      const sensorProcess = this.sensorProcess;
+      if (sensorProcess) {
+        sensorProcess.kill('SIGTERM');
         
         // Wait for process to exit gracefully
         await new Promise((resolve) => {
           const timeout = setTimeout(() => {
-            if (this.sensorProcess) {
-              this.sensorProcess.kill('SIGKILL');
-            }
+            sensorProcess.kill('SIGKILL');
             resolve(true);
           }, 5000);
 
-          this.sensorProcess.on('exit', () => {
+          sensorProcess.on('exit', () => {
             clearTimeout(timeout);
             resolve(true);
           });
         });
       }
 
-      this.isRunning = false;
       this.sensorProcess = null;
       this.logger.debug('DHT11 sensor stopped successfully');
       return true;
@@ -115,6 +110,71 @@ class RaspberryPiDeviceOperations implements IDeviceOperations {
     }
   }
 
+  /**
+   * @method spawnSensorProcess
+   * @description Spawns the Python sensor script, restarting it when it exits unexpectedly
+   * 
+   * @param {string} scriptPath - Path to the sensor script
+   * @private
+   */
+  private spawnSensorProcess(scriptPath: string) {
+    const spawnedAt = Date.now();
+    this.sensorProcess = spawn('python3', [scriptPath], {
+      stdio: 'pipe'
+    });
+
+    this.sensorProcess.stdout.on('data', (data) => {
+      this.logger.debug(`Sensor output: ${data.toString()}`);
+    });
+
+    this.sensorProcess.stderr.on('data', (data) => {
+      this.logger.error(`Sensor error: ${data.toString()}`);
+    });
+
+    this.sensorProcess.on('close', (code) => {
+      this.logger.debug(`Sensor process exited with code ${code}`);
+      this.sensorProcess = null;
+
+      if (this.isRunning) {
+        // Only a process that stayed up for a while earns a fresh retry budget, so a
+        // script that prints a banner and then crashes still runs out of attempts
+        if (Date.now() - spawnedAt >= this.stableUptimeMs) {
+          this.restartAttempts = 0;
+        }
+        this.scheduleRestart(scriptPath);
+      }
+    });
+  }
+
+  /**
+   * @method scheduleRestart
+   * @description Restarts a crashed sensor process
+   * 
+   * DHT11 failures are usually transient, so the first restart is immediate and
+   * only repeated failures back off exponentially.
+   * 
+   * @param {string} scriptPath - Path to the sensor script
+   * @private
+   */
+  private scheduleRestart(scriptPath: string) {
+    if (this.restartAttempts >= this.maxRestartAttempts) {
+      this.logger.error(`Sensor process failed ${this.restartAttempts} times in a row, giving up`);
+      this.isRunning = false;
+      return;
+    }
+
+    const delay = this.restartAttempts === 0 ? 0 : getBackoffDelay(this.restartAttempts - 1);
+    this.restartAttempts++;
+    this.logger.debug(`Restarting sensor process in ${Math.round(delay)}ms (attempt ${this.restartAttempts})`);
+
+    this.restartTimer = setTimeout(() => {
+      this.restartTimer = null;
+      if (this.isRunning) {
+        this.spawnSensorProcess(scriptPath);
+      }
+    }, delay);
+  }
+
   /**
    * @method getStatus
    * @description Gets current sensor status
@@ -0,0 +1,51 @@
+import { getBackoffDelay, isRetryableHttpError, retryWithBackoff } from './index';
+
+describe('shared helpers', () => {
+  describe('getBackoffDelay', () => {
+    it('should grow exponentially without jitter', () => {
+      expect(getBackoffDelay(0, 100, 10000, 0)).toBe(100);
+      expect(getBackoffDelay(3, 100, 10000, 0)).toBe(800);
+    });
+
+    it('should never exceed the cap plus jitter', () => {
+      for (let attempt = 0; attempt < 20; attempt++) {
+        expect(getBackoffDelay(attempt, 100, 1000, 0.5)).toBeLessThanOrEqual(1500);
+      }
+    });
+  });
+
+  describe('retryWithBackoff', () => {
+    it('should resolve once the function succeeds', async () => {
+      const fn = jest.fn()
+        .mockRejectedValueOnce(new Error('timeout'))
+        .mockResolvedValue('ok');
+
+      await expect(retryWithBackoff(fn, { baseDelayMs: 0 })).resolves.toBe('ok');
+      expect(fn).toHaveBeenCalledTimes(2);
+    });
+
+    it('should give up after maxRetries', async () => {
+      const fn = jest.fn().mockRejectedValue(new Error('down'));
+
+      await expect(retryWithBackoff(fn, { maxRetries: 2, baseDelayMs: 0 })).rejects.toThrow('down');
+      expect(fn).toHaveBeenCalledTimes(3);
+    });
+
+    it('should not retry unrecoverable errors', async () => {
+      const fn = jest.fn().mockRejectedValue({ response: { status: 404 } });
+
+      await expect(retryWithBackoff(fn, { baseDelayMs: 0, isRetryable: isRetryableHttpError })).rejects.toEqual({ response: { status: 404 } });
+      expect(fn).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('isRetryableHttpError', () => {
+    it('should classify HTTP failures', () => {
+      expect(isRetryableHttpError(new Error('ECONNREFUSED'))).toBe(true);
+      expect(isRetryableHttpError({ response: { status: 408 } })).toBe(true);
+      expect(isRetryableHttpError({ response: { status: 429 } })).toBe(true);
+      expect(isRetryableHttpError({ response: { status: 503 } })).toBe(true);
+      expect(isRetryableHttpError({ response: { status: 400 } })).toBe(false);
+    });
+  });
+});
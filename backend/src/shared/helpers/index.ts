@@ -0,0 +1,53 @@
+export interface RetryOptions {
+  maxRetries?: number;
+  baseDelayMs?: number;
+  maxDelayMs?: number;
+  jitter?: number;
+  isRetryable?: (error: any) => boolean;
+}
+
+export const sleep = (ms: number): Promise<void> => {
+  return new Promise(resolve => setTimeout(resolve, ms));
+};
+
+/**
+ * Exponential backoff capped at maxDelayMs, randomised by ±jitter so that
+ * many devices failing at once do not retry in lockstep
+ */
+export const getBackoffDelay = (attempt: number, baseDelayMs = 1000, maxDelayMs = 30000, jitter = 0.5): number => {
+  const delay = Math.min(maxDelayMs, baseDelayMs * 2 ** attempt);
+  return delay * (1 + (Math.random() * 2 - 1) * jitter);
+};
+
+export const retryWithBackoff = async <T>(fn: () => Promise<T>, options: RetryOptions = {}): Promise<T> => {
+  const {
+    maxRetries = 3,
+    baseDelayMs = 1000,
+    maxDelayMs = 30000,
+    jitter = 0.5,
+    isRetryable = () => true
+  } = options;
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      if (attempt >= maxRetries || !isRetryable(error)) {
+        throw error;
+      }
+      await sleep(getBackoffDelay(attempt, baseDelayMs, maxDelayMs, jitter));
+    }
+  }
+};
+
+/**
+ * Network errors, timeouts, throttling and server errors are worth retrying;
+ * any other 4xx will fail the same way again
+ */
+export const isRetryableHttpError = (error: any): boolean => {
+  const status = error?.response?.status;
+  if (!status) {
+    return true;
+  }
+  return status === 408 || status === 429 || status >= 500;
+};
@@ -144,6 +144,8 @@ export class DeviceClientService implements OnModuleInit, OnModuleDestroy {
         },
         reconnection: true,
         reconnectionDelay: 2000,
+        reconnectionDelayMax: 30000,
+        randomizationFactor: 0.5,
         reconnectionAttempts: this.maxReconnectAttempts
       });
 
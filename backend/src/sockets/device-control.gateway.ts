@@ -77,6 +77,7 @@ export interface IDeviceRegistration {
 export class DeviceControlGateway implements OnGatewayConnection, OnGatewayDisconnect {
   private readonly logger: LoggerHelper = new LoggerHelper(DeviceControlGateway.name);
   private connectedDevices: Map<string, Socket> = new Map();
+  private socketDevices: Map<string, string> = new Map(); // socket id -> device id
   private deviceRegistrations: Map<string, IDeviceRegistration> = new Map();
 
   @WebSocketServer()
@@ -96,6 +97,7 @@ export class DeviceControlGateway implements OnGatewayConnection, OnGatewayDisco
     
     if (deviceId) {
       this.connectedDevices.set(deviceId, client);
+      this.socketDevices.set(client.id, deviceId);
       this.deviceRegistrations.set(deviceId, { deviceId, medallionId, authToken });
       
       this.logger.debug(`Device registered: ${deviceId} ${medallionId ? `(medallion: ${medallionId})` : ''}`);
@@ -120,13 +122,14 @@ export class DeviceControlGateway implements OnGatewayConnection, OnGatewayDisco
    */
   handleDisconnect(client: Socket) {
     // Find and remove the device from our maps
-    for (const [deviceId, socket] of this.connectedDevices.entries()) {
-      if (socket.id === client.id) {
-        this.connectedDevices.delete(deviceId);
-        this.deviceRegistrations.delete(deviceId);
-        this.logger.debug(`Device disconnected: ${deviceId}`);
-        break;
-      }
+    const deviceId = this.socketDevices.get(client.id);
+    this.socketDevices.delete(client.id);
+
+    // Ignore a stale socket whose device has already reconnected on a new one
+    if (deviceId && this.connectedDevices.get(deviceId)?.id === client.id) {
+      this.connectedDevices.delete(deviceId);
+      this.deviceRegistrations.delete(deviceId);
+      this.logger.debug(`Device disconnected: ${deviceId}`);
     }
   }
 